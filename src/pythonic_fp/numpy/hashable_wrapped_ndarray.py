@@ -12,11 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from abc import ABC, abstractmethod
 from enum import auto, Enum
+from pickle import PickleBuffer
+from typing import Any, cast, Self, SupportsIndex
+from weakref import WeakValueDictionary
 import numpy as np
 import numpy.typing as npt
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None  # type: ignore[assignment]
+
 __all__ = [
     'DTypes',
     'HWrapNDArray',
@@ -62,8 +69,155 @@ class DTypes(Enum):
     timedelta64 = auto()
     bool_ = auto()
 
+    # Enum members are singletons compared by identity, an identity hash
+    # avoids the Python level Enum.__hash__ when hashing (shape, type).
+    __hash__ = object.__hash__
+
+
+_KIND_TO_DTYPE: dict[str, DTypes] = {
+    'b': DTypes.bool_,
+    'i': DTypes.number,
+    'u': DTypes.number,
+    'f': DTypes.number,
+    'c': DTypes.number,
+    'U': DTypes.str_,
+    'S': DTypes.bytes,
+    'M': DTypes.datetime64,
+    'm': DTypes.timedelta64,
+    'V': DTypes.void,
+    'O': DTypes.object_,
+}
+
+
+def _buffer_hash(ndarray: npt.NDArray[np.generic]) -> int:
+    """Hash the raw data buffer of an NDArray.
+
+    - with xxhash, a C-contiguous NDArray without object references is
+      hashed with xxh3 in place through the buffer protocol
+    - with xxhash, any other NDArray is hashed with xxh3 on
+      ``ndarray.tobytes()``
+    - without xxhash, the builtin ``hash`` of ``ndarray.tobytes()``
+      is used
 
-class HWrapNDArray(ABC):
+    """
+    if xxhash is None:
+        return hash(ndarray.tobytes())
+    if ndarray.flags.c_contiguous and not ndarray.dtype.hasobject:
+        return xxhash.xxh3_64_intdigest(ndarray)
+    return xxhash.xxh3_64_intdigest(ndarray.tobytes())
+
+
+_SMALL_NBYTES = 1 << 16
+
+_UINT_DTYPES = tuple((w, np.dtype(f'u{w}')) for w in (8, 4, 2, 1))
+
+
+def _same_data(a: npt.NDArray[np.generic], b: npt.NDArray[np.generic]) -> bool:
+    """Compare the raw data buffers of two NDArrays of equal dtype and shape.
+
+    Small data buffers are compared as bytes, so with ``memcmp``. Larger
+    ones are compared in one vectorised pass over unsigned integer views,
+    as wide as the buffer size allows.
+
+    """
+    nbytes = a.nbytes
+    if nbytes <= _SMALL_NBYTES:
+        return a.tobytes() == b.tobytes()
+    for width, uint in _UINT_DTYPES:
+        if nbytes % width == 0:
+            break
+    a_uint = np.ascontiguousarray(a).reshape(-1).view(uint)
+    b_uint = np.ascontiguousarray(b).reshape(-1).view(uint)
+    return bool((a_uint == b_uint).all())
+
+
+def _from_buffer(
+    cls: 'type[HWrapNDArray]',
+    buffer: PickleBuffer | bytes,
+    dtype: np.dtype[Any],
+    shape: tuple[int, ...],
+) -> 'HWrapNDArray':
+    """Unpickle a wrapper pickled with its raw data buffer."""
+    return cls(np.frombuffer(buffer, dtype=dtype).reshape(shape))
+
+
+def _is_immutable(ndarray: npt.NDArray[np.generic]) -> bool:
+    """Check if an NDArray can be wrapped without copying it.
+
+    The NDArray must be read-only and get its data from an immutable
+    ``bytes`` object. An NDArray owning its data does not qualify, its
+    owner can make it writable again. Nor does a read-only view of
+    writable memory.
+
+    """
+    if ndarray.flags.writeable:
+        return False
+    base = ndarray.base
+    while isinstance(base, np.ndarray) and not base.flags.owndata:
+        base = base.base
+    return isinstance(base, bytes)
+
+
+def _wrap_result(result: Any) -> 'HWrapNDArray':
+    """Wrap the result of a NumPy operation without copying it."""
+    return _hwrap(HWrapNDArray, np.asarray(result), owned=True)
+
+
+def _hwrap(
+    cls: 'type[HWrapNDArray]',
+    array: npt.NDArray[Any],
+    owned: bool,
+) -> 'HWrapNDArray':
+    """Construct or look up the interned wrapper of an NDArray.
+
+    The NDArray is stored without copying when it is C-contiguous and
+    either backed by immutable memory or, with ``owned``, a fresh result
+    not referenced anywhere else. Otherwise a read-only copy is stored.
+
+    """
+    try:
+        dtype_type = _KIND_TO_DTYPE[array.dtype.kind]
+    except KeyError:
+        msg = f"HWrapNDArray: Unknown np.dtype '{array.dtype}'"
+        raise TypeError(msg) from None
+    if cls is HWrapNDArray:
+        cls = _DTYPE_TO_CLASS[dtype_type]
+
+    # Arrays of object references are mutable through those references,
+    # so only intern wrappers of arrays containing plain data.
+    h: int | None = None
+    if not array.dtype.hasobject:
+        h = _buffer_hash(array) ^ hash((array.shape, dtype_type))
+        interned = _INTERN.get(h)
+        if (
+            interned is not None
+            and type(interned) is cls
+            and interned._shape == array.shape
+            and interned._ndarray.dtype == array.dtype
+            and _same_data(interned._ndarray, array)
+        ):
+            return interned
+
+    hwrap = object.__new__(cls)
+    if array.flags.c_contiguous and (owned or _is_immutable(array)):
+        array.setflags(write=False)
+        hwrap._ndarray = array
+    else:
+        hwrap._ndarray = array.copy()
+        hwrap._ndarray.setflags(write=False)
+    hwrap._type = dtype_type
+    hwrap._shape = array.shape
+    hwrap._hash = h
+    hwrap._repr_cache = None
+    if h is not None:
+        # On a hash collision between different data, this replaces the
+        # live entry. The older wrapper stays valid, it is just no
+        # longer returned when interning.
+        _INTERN[h] = hwrap
+    return hwrap
+
+
+class HWrapNDArray:
     """
     Make NumPy NDArrays hashable.
 
@@ -71,42 +225,56 @@ class HWrapNDArray(ABC):
     stores a read-only copy of the NDArray given to the constructor and
     is hashable.
 
+    .. note::
+
+        A C-contiguous read-only NDArray whose data comes from an
+        immutable ``bytes`` object is stored without copying. Any other
+        NDArray is copied.
+
+    .. note::
+
+        Calling ``HWrapNDArray`` directly returns an instance of the
+        subclass matching the dtype of the NDArray.
+
+    .. note::
+
+        The ``+``, ``*`` and ``@`` operators apply the NumPy operator
+        to the wrapped NDArrays and wrap the result without copying it.
+
+    .. note::
+
+        Wrappers are interned. Constructing a wrapper from data equal to
+        that of a live wrapper of the same class returns that wrapper.
+        NDArrays containing object references are never interned.
+
+        Interning hashes the data buffer, so construction is O(n) in the
+        size of the NDArray. Only NDArrays containing object references
+        are hashed lazily.
+
     """
 
-    __slots__ = '_ndarray', '_type', '_shape', '_hash'
-
-    def __init__(self, ndarray: npt.NDArray[np.generic]) -> None:
-        self._ndarray = np.array(ndarray, copy=True)
-        self._ndarray.setflags(write=False)
-
-        dtype = self._ndarray.dtype.type
-        if issubclass(dtype, np.number):
-            self._type = DTypes.number
-        elif isinstance(dtype, np.str_):
-            self._type = DTypes.str_
-        elif issubclass(dtype, np.bytes_):
-            self._type = DTypes.bytes
-        elif issubclass(dtype, np.datetime64):
-            self._type = DTypes.datetime64
-        elif issubclass(dtype, np.timedelta64):
-            self._type = DTypes.timedelta64
-        elif issubclass(dtype, np.bool_):
-            self._type = DTypes.bool_
-        elif issubclass(dtype, np.void):
-            self._type = DTypes.void
-        elif issubclass(dtype, np.object_):
-            self._type = DTypes.object_
-        else:
-            msg = f"HWrapNDArray: Unknow np.dtype '{dtype}'"
-            raise TypeError(msg)
+    __slots__ = (
+        '_ndarray',
+        '_type',
+        '_shape',
+        '_hash',
+        '_repr_cache',
+        '__weakref__',
+    )
 
-        self._shape = self._ndarray.shape
-        self._hash = hash((self._ndarray.tobytes(), hash((self._shape, self._type))))
+    _ndarray: npt.NDArray[Any]
+    _type: DTypes
+    _shape: tuple[int, ...]
+    _hash: int | None
+    _repr_cache: str | None
 
-    @abstractmethod
-    def __repr__(self) -> str: ...
+    def __new__(cls, ndarray: npt.NDArray[np.generic]) -> Self:
+        return cast(Self, _hwrap(cls, np.asarray(ndarray), owned=False))
 
-    def __call__(self) -> npt.NDArray[np.number]:
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._repr()})'
+
+    def __call__(self) -> npt.NDArray[Any]:
         """Return a reference to the stored NDArray.
 
         .. warning::
@@ -119,100 +287,116 @@ class HWrapNDArray(ABC):
             - Never make the underlying NDArray writable!!!
 
         """
-        return np.array(self._ndarray)
+        return self._ndarray
 
     def __hash__(self) -> int:
-        return self._hash
+        """Return the hash computed by the constructor.
+
+        NDArrays containing object references are not interned, so
+        their hash is computed on first use, then cached.
+
+        """
+        if (h := self._hash) is None:
+            meta_hash = hash((self._shape, self._type))
+            h = self._hash = _buffer_hash(self._ndarray) ^ meta_hash
+        return h
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, HWrapNDArray):
             return False
-        if self._shape != other._shape or self._type != other._type:
+        if self._shape != other._shape or self._type is not other._type:
+            return False
+        s_hash, o_hash = self._hash, other._hash
+        if s_hash is not None and o_hash is not None and s_hash != o_hash:
             return False
-        return np.array_equal(self._ndarray, other._ndarray)
+        s_array, o_array = self._ndarray, other._ndarray
+        s_dtype = s_array.dtype
+        if s_dtype.hasobject:
+            return bool(np.array_equal(s_array, o_array))
+        if s_dtype != o_array.dtype:
+            return False
+        return _same_data(s_array, o_array)
+
+    def __add__(self, other: object) -> 'HWrapNDArray':
+        if not isinstance(other, HWrapNDArray):
+            return NotImplemented
+        return _wrap_result(self._ndarray + other._ndarray)
+
+    def __mul__(self, other: object) -> 'HWrapNDArray':
+        if not isinstance(other, HWrapNDArray):
+            return NotImplemented
+        return _wrap_result(self._ndarray * other._ndarray)
+
+    def __matmul__(self, other: object) -> 'HWrapNDArray':
+        if not isinstance(other, HWrapNDArray):
+            return NotImplemented
+        return _wrap_result(self._ndarray @ other._ndarray)
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]:
+        """Pickle the wrapped NDArray, not the process specific hash.
+
+        The data buffer of an NDArray without object references is
+        pickled with its exact dtype, so byte order survives the round
+        trip. With pickle protocol 5 or later, the buffer is handed to
+        pickle as a PickleBuffer, allowing out-of-band transfer without
+        copying (PEP 574), otherwise as ``ndarray.tobytes()``.
+
+        """
+        ndarray = self._ndarray
+        if ndarray.dtype.hasobject:
+            return type(self), (ndarray,)
+        buffer: PickleBuffer | bytes
+        if int(protocol) >= 5:
+            buffer = PickleBuffer(ndarray.reshape(-1).view(np.uint8))
+        else:
+            buffer = ndarray.tobytes()
+        return _from_buffer, (type(self), buffer, ndarray.dtype, self._shape)
 
     def __str__(self) -> str:
         np_array_str = '  ' + str(self._ndarray).replace('\n', '\n  ')
         return f'hwrap<\n{np_array_str}\n>'
 
     def _repr(self) -> str:
-        stripped_repr = ''.join(repr(self._ndarray).split())
-        return f'np.{stripped_repr}'
+        """Whitespace free repr of the wrapped NDArray, computed once."""
+        if (cached := self._repr_cache) is None:
+            stripped_repr = ''.join(repr(self._ndarray).split())
+            cached = self._repr_cache = f'np.{stripped_repr}'
+        return cached
 
-    def copy(self) -> npt.NDArray[np.number]:
+    def copy(self) -> npt.NDArray[Any]:
         """Return a copy of the wrapped NDArray."""
-        return np.array(self._ndarray, copy=True)
+        return self._ndarray.copy()
 
 
 class HWrapNDArrayNumber(HWrapNDArray):
     """Wrap NDArrays of arbitrary NumPy numeric types."""
 
-    def __init__(self, ndarray: npt.NDArray[np.number]) -> None:
-        super().__init__(ndarray)
-
-    def __repr__(self) -> str:
-        return f'HWrapNDArrayNumber({self._repr()})'
-
 
 class HWrapNDArrayString(HWrapNDArray):
     """Wrap NDArrays of Unicode strings."""
 
-    def __init__(self, ndarray: npt.NDArray[np.str_]) -> None:
-        super().__init__(ndarray)
-
-    def __repr__(self) -> str:
-        return f'HWrapNDArrayStr({self._repr()})'
-
 
 class HWrapNDArrayBytes(HWrapNDArray):
     """Wrap NDArrays of null-terminated byte sequences."""
 
-    def __init__(self, ndarray: npt.NDArray[np.bytes_]) -> None:
-        super().__init__(ndarray)
-
-    def __repr__(self) -> str:
-        return f'HWrapNDArrayBytes({self._repr()})'
-
 
 class HWrapNDArrayDateTime(HWrapNDArray):
-    """Wrap NDArrays of references to arbitrary Python objects."""
-
-    def __init__(self, ndarray: npt.NDArray[np.datetime64]) -> None:
-        super().__init__(ndarray)
-
-    def __repr__(self) -> str:
-        return f'HWrapNDArrayTimeDelta({self._repr()})'
+    """Wrap NDArrays of dates and times."""
 
 
 class HWrapNDArrayTimeDelta(HWrapNDArray):
-    """Wrap NDArrays of references to arbitrary Python objects."""
-
-    def __init__(self, ndarray: npt.NDArray[np.timedelta64]) -> None:
-        super().__init__(ndarray)
-
-    def __repr__(self) -> str:
-        return f'HWrapNDArrayTimeDelta({self._repr()})'
+    """Wrap NDArrays of time durations."""
 
 
 class HWrapNDArrayVoid(HWrapNDArray):
     """Wrap NDArrays of arbitrary byte sequences."""
 
-    def __init__(self, ndarray: npt.NDArray[np.void]) -> None:
-        super().__init__(ndarray)
-
-    def __repr__(self) -> str:
-        return f'HWrapNDArrayVoid({self._repr()})'
-
 
 class HWrapNDArrayObject(HWrapNDArray):
     """Wrap NDArrays of references to arbitrary Python objects."""
 
-    def __init__(self, ndarray: npt.NDArray[np.object_]) -> None:
-        super().__init__(ndarray)
-
-    def __repr__(self) -> str:
-        return f'HWrapNDArrayObject({self._repr()})'
-
 
 class HWrapNDArrayBool(HWrapNDArray):
     """Wrap NDArrays of Booleans.
@@ -228,8 +412,16 @@ class HWrapNDArrayBool(HWrapNDArray):
 
     """
 
-    def __init__(self, ndarray: npt.NDArray[np.bool_]) -> None:
-        super().__init__(ndarray)
 
-    def __repr__(self) -> str:
-        return f'HWrapNDArrayBool({self._repr()})'
+_INTERN: WeakValueDictionary[int, HWrapNDArray] = WeakValueDictionary()
+
+_DTYPE_TO_CLASS: dict[DTypes, type[HWrapNDArray]] = {
+    DTypes.number: HWrapNDArrayNumber,
+    DTypes.str_: HWrapNDArrayString,
+    DTypes.bytes: HWrapNDArrayBytes,
+    DTypes.void: HWrapNDArrayVoid,
+    DTypes.object_: HWrapNDArrayObject,
+    DTypes.datetime64: HWrapNDArrayDateTime,
+    DTypes.timedelta64: HWrapNDArrayTimeDelta,
+    DTypes.bool_: HWrapNDArrayBool,
+}
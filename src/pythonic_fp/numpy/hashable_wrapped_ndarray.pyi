@@ -1,8 +1,7 @@
-import abc
 import numpy as np
 import numpy.typing as npt
-from abc import ABC
 from enum import Enum
+from typing import Any, overload, Self, SupportsIndex
 
 __all__ = ['DTypes', 'HWrapNDArray', 'HWrapNDArrayNumber', 'HWrapNDArrayString', 'HWrapNDArrayBytes', 'HWrapNDArrayVoid', 'HWrapNDArrayObject', 'HWrapNDArrayDateTime', 'HWrapNDArrayTimeDelta', 'HWrapNDArrayBool']
 
@@ -16,15 +15,38 @@ class DTypes(Enum):
     timedelta64 = ...
     bool_ = ...
 
-class HWrapNDArray(ABC, metaclass=abc.ABCMeta):
+class HWrapNDArray:
+    def __new__(cls, ndarray: npt.NDArray[np.generic]) -> Self: ...
     def __init__(self, ndarray: npt.NDArray[np.generic]) -> None: ...
-    def __call__(self) -> npt.NDArray[np.number]: ...
+    def __call__(self) -> npt.NDArray[Any]: ...
     def __hash__(self) -> int: ...
     def __eq__(self, other: object) -> bool: ...
-    def copy(self) -> npt.NDArray[np.number]: ...
+    def __add__(self, other: object) -> HWrapNDArray: ...
+    def __mul__(self, other: object) -> HWrapNDArray: ...
+    def __matmul__(self, other: object) -> HWrapNDArray: ...
+    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[Any, ...]: ...
+    def copy(self) -> npt.NDArray[Any]: ...
 
 class HWrapNDArrayNumber(HWrapNDArray):
     def __init__(self, ndarray: npt.NDArray[np.number]) -> None: ...
+    @overload
+    def __add__(
+        self, other: HWrapNDArrayNumber | HWrapNDArrayBool
+    ) -> HWrapNDArrayNumber: ...
+    @overload
+    def __add__(self, other: object) -> HWrapNDArray: ...
+    @overload
+    def __mul__(
+        self, other: HWrapNDArrayNumber | HWrapNDArrayBool
+    ) -> HWrapNDArrayNumber: ...
+    @overload
+    def __mul__(self, other: object) -> HWrapNDArray: ...
+    @overload
+    def __matmul__(
+        self, other: HWrapNDArrayNumber | HWrapNDArrayBool
+    ) -> HWrapNDArrayNumber: ...
+    @overload
+    def __matmul__(self, other: object) -> HWrapNDArray: ...
 
 class HWrapNDArrayString(HWrapNDArray):
     def __init__(self, ndarray: npt.NDArray[np.str_]) -> None: ...
@@ -46,3 +68,21 @@ class HWrapNDArrayTimeDelta(HWrapNDArray):
 
 class HWrapNDArrayBool(HWrapNDArray):
     def __init__(self, ndarray: npt.NDArray[np.bool_]) -> None: ...
+    @overload
+    def __add__(self, other: HWrapNDArrayBool) -> HWrapNDArrayBool: ...
+    @overload
+    def __add__(self, other: HWrapNDArrayNumber) -> HWrapNDArrayNumber: ...
+    @overload
+    def __add__(self, other: object) -> HWrapNDArray: ...
+    @overload
+    def __mul__(self, other: HWrapNDArrayBool) -> HWrapNDArrayBool: ...
+    @overload
+    def __mul__(self, other: HWrapNDArrayNumber) -> HWrapNDArrayNumber: ...
+    @overload
+    def __mul__(self, other: object) -> HWrapNDArray: ...
+    @overload
+    def __matmul__(self, other: HWrapNDArrayBool) -> HWrapNDArrayBool: ...
+    @overload
+    def __matmul__(self, other: HWrapNDArrayNumber) -> HWrapNDArrayNumber: ...
+    @overload
+    def __matmul__(self, other: object) -> HWrapNDArray: ...
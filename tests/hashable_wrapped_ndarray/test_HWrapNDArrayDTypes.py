@@ -0,0 +1,123 @@
+# Copyright 2026 Geoffrey R. Scheller
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import numpy as np
+import numpy.typing as npt
+import pytest
+from pythonic_fp.numpy.hashable_wrapped_ndarray import (
+    HWrapNDArray,
+    HWrapNDArrayBool,
+    HWrapNDArrayBytes,
+    HWrapNDArrayDateTime,
+    HWrapNDArrayNumber,
+    HWrapNDArrayObject,
+    HWrapNDArrayString,
+    HWrapNDArrayTimeDelta,
+    HWrapNDArrayVoid,
+)
+
+
+class Test_dtype_kinds:
+    def test_string(self) -> None:
+        w = HWrapNDArrayString(np.array(['a']))
+        assert type(HWrapNDArray(np.array(['a']))) is HWrapNDArrayString
+        assert w == HWrapNDArrayString(np.array(['a']))
+        assert hash(w) == hash(HWrapNDArrayString(np.array(['a'])))
+
+    def test_non_numeric_kinds(self) -> None:
+        cases: list[tuple[type[HWrapNDArray], npt.NDArray[np.generic]]] = [
+            (HWrapNDArrayBytes, np.array([b'ab', b'c'])),
+            (HWrapNDArrayDateTime, np.array(['2026-01-16'], dtype='M8[D]')),
+            (HWrapNDArrayTimeDelta, np.array([3, 5], dtype='m8[s]')),
+            (HWrapNDArrayVoid, np.zeros(2, dtype='V3')),
+            (HWrapNDArrayBool, np.array([True, False])),
+            (HWrapNDArrayObject, np.array([1, 'a', None], dtype=object)),
+        ]
+        for hwrap_type, ndarray in cases:
+            w = hwrap_type(ndarray)
+            assert type(HWrapNDArray(ndarray)) is hwrap_type
+            assert w == hwrap_type(ndarray.copy())
+            assert hash(w) == hash(w)
+
+    def test_unknown_kind(self) -> None:
+        with pytest.raises(TypeError):
+            HWrapNDArrayString(np.array(['a'], dtype=np.dtypes.StringDType()))
+
+
+class Test_read_only_views:
+    def test_view_of_writable_memory_is_copied(self) -> None:
+        a = np.arange(4)
+        b = a.view()
+        b.setflags(write=False)
+        w = HWrapNDArrayNumber(b)
+        h = hash(w)
+        a[0] = 99
+        assert w().tolist() == [0, 1, 2, 3]
+        assert hash(w) == h
+        assert w == HWrapNDArrayNumber(np.array([0, 1, 2, 3]))
+        assert w != HWrapNDArrayNumber(np.array([99, 1, 2, 3]))
+
+    def test_owned_read_only_array_is_copied(self) -> None:
+        a = np.arange(5, 9)
+        a.setflags(write=False)
+        w = HWrapNDArrayNumber(a)
+        h = hash(w)
+        a.setflags(write=True)
+        a[0] = 99
+        assert w().tolist() == [5, 6, 7, 8]
+        assert hash(w) == h
+        assert w == HWrapNDArrayNumber(np.array([5, 6, 7, 8]))
+
+    def test_array_from_bytes_is_not_copied(self) -> None:
+        a = np.frombuffer(bytes(range(16)), dtype=np.int32).reshape(2, 2)
+        assert HWrapNDArrayNumber(a)() is a
+
+
+class Test_repr:
+    def test_string_repr(self) -> None:
+        w = HWrapNDArrayString(np.array(['ab', 'c']))
+        assert repr(w) == "HWrapNDArrayString(np.array(['ab','c'],dtype='<U2'))"
+
+    def test_datetime_repr(self) -> None:
+        w = HWrapNDArrayDateTime(np.array(['2026-01-16'], dtype='M8[D]'))
+        assert (
+            repr(w)
+            == "HWrapNDArrayDateTime(np.array(['2026-01-16'],dtype='datetime64[D]'))"
+        )
+
+
+class Test_dispatch:
+    def test_dispatch_to_subclass(self) -> None:
+        assert type(HWrapNDArray(np.array([True]))) is HWrapNDArrayBool
+        assert type(HWrapNDArray(np.array(['a']))) is HWrapNDArrayString
+        assert type(HWrapNDArray(np.array([1.5]))) is HWrapNDArrayNumber
+
+    def test_dispatch_interns_with_subclass(self) -> None:
+        x = np.array([[3, 1], [4, 1]], dtype=np.int32)
+        assert HWrapNDArray(x) is HWrapNDArrayNumber(x)
+
+    def test_dispatch_unknown_kind(self) -> None:
+        with pytest.raises(TypeError):
+            HWrapNDArray(np.array(['a'], dtype=np.dtypes.StringDType()))
+
+
+class Test_pickle:
+    def test_non_native_byte_order(self) -> None:
+        w = HWrapNDArray(np.array([1, 2], dtype='>i4'))
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            u = pickle.loads(pickle.dumps(w, protocol))
+            assert u().dtype == np.dtype('>i4')
+            assert u == w
+            assert u is w
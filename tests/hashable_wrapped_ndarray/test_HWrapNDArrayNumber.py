@@ -12,16 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
 import numpy as np
-import numpy.typing as npt
 from boring_math.abstract_algebra.algebras.semigroup import Semigroup
 from pythonic_fp.numpy.hashable_wrapped_ndarray import HWrapNDArrayNumber
 
-type I32_2x2 = HWrapNDArrayNumber[npt.NDArray[np.int32]]
+type I32_2x2 = HWrapNDArrayNumber
 
 
 def matrix_mult(left: I32_2x2, right: I32_2x2) -> I32_2x2:
-    return HWrapNDArrayNumber(left() @ right())
+    return left @ right
 
 
 m2x2 = Semigroup[I32_2x2](mult=matrix_mult)
@@ -55,6 +55,36 @@ class Test_number_with_int32:
         assert D * D == Eye
         assert A * B == E
 
+    def test_wrapper_equality(self) -> None:
+        np_a = HWrapNDArrayNumber(np.array([[5, -1], [0, 2]], dtype=np.int32))
+        assert np_a is np_A
+        assert np_a == np_A
+        assert hash(np_a) == hash(np_A)
+        assert np_a != np_B
+        assert np_a != HWrapNDArrayNumber(np.array([[5, -1], [0, 2]], dtype=np.int64))
+        assert np_a != HWrapNDArrayNumber(np.array([5, -1, 0, 2], dtype=np.int32))
+
+    def test_operators(self) -> None:
+        assert np_A @ np_B is np_E
+        assert np_eye @ np_A is np_A
+        assert np_D @ np_D is np_eye
+        assert np_A @ np_zero is np_zero
+        assert np_A + np_zero is np_A
+        assert np_C * np_D is np_D
+        assert np_C + np_C == HWrapNDArrayNumber(2 * np_C())
+        np_sum = np_A + np_B
+        assert (
+            repr(np_sum) == 'HWrapNDArrayNumber(np.array([[7,-2],[-1,4]],dtype=int32))'
+        )
+
+    def test_pickle(self) -> None:
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(np_A, protocol)) is np_A
+        buffers: list[pickle.PickleBuffer] = []
+        pickled = pickle.dumps(np_E, 5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        assert pickle.loads(pickled, buffers=buffers) == np_E
+
     def test_identity(self) -> None:
         assert Eye * Eye is Eye
         assert Eye * A is A